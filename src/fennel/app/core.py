@@ -16,9 +16,11 @@ class MyTrameApp(TrameApp):
         if self.server.hot_reload:
             self.server.controller.on_server_reload.add(self._build_ui)
 
-        # Set state variable
-        self.state.trame__title = "fennel"
-        self.state.resolution = 6
+        # Set state variables
+        self.state.update({
+            "trame__title": "fennel",
+            "resolution": 6,
+        })
 
         # build ui
         self._build_ui()